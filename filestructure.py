@@ -1,7 +1,26 @@
 import os
+import sys
 import json
-import re
+import locale
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Create entries relative to an open parent directory where supported
+_HAVE_DIR_FD = {os.open, os.mkdir} <= os.supports_dir_fd
+_DIR_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+
+# Tree symbols and indentation preceding an entry name, GNU tree indents
+# nested levels with non-breaking spaces
+_TREE_CHARS = '│├└─ \u00a0'
+
+# Kinds of entries in a tree specification, looked up by the exact type
+# of the entry's value
+_DIR, _EMPTY_FILE, _CONTENT_FILE = 0, 1, 2
+_ENTRY_KINDS = {dict: _DIR, type(None): _EMPTY_FILE, str: _CONTENT_FILE}
+
+# Flags for touching an empty file and for writing a file's content
+_TOUCH_FLAGS = os.O_WRONLY | os.O_CREAT
+_WRITE_FLAGS = _TOUCH_FLAGS | os.O_TRUNC
 
 class ProjectStructureParser:
     def __init__(self, encoding='utf-8'):
@@ -16,92 +35,108 @@ class ProjectStructureParser:
         """
         Parse a text file representing a directory structure.
         
-        :param input_file: Path to the input text file
+        :param input_file: Path to the input text file, or an open text file
         :return: Nested dictionary representing the project structure
         """
-        with open(input_file, 'r', encoding=self.encoding) as f:
-            lines = f.readlines()
+        if not isinstance(input_file, (str, bytes, os.PathLike)):
+            # Already an open file
+            return self._build_structure_dict(self._iter_lines(input_file))
         
-        # Remove empty lines and trailing whitespaces
-        lines = [line.rstrip() for line in lines if line.strip()]
+        with open(input_file, 'r', encoding=self.encoding) as f:
+            return self._build_structure_dict(self._iter_lines(f))
+
+    @staticmethod
+    def _iter_lines(f):
+        """
+        Lazily read the lines of a text file.
         
-        return self._build_structure_dict(lines)
+        :param f: Open text file
+        :return: Iterator over non-empty lines without trailing whitespaces
+        """
+        for line in map(str.rstrip, f):
+            if line:
+                # Tab stops line up with the 4 character wide tree levels,
+                # only lines that contain tabs need to be expanded
+                yield line.expandtabs(4) if '\t' in line else line
 
     def _build_structure_dict(self, lines):
         """
-        Recursively build a nested dictionary from tree-style lines.
+        Build a nested dictionary from tree-style lines in a single pass.
         
-        :param lines: List of lines representing the directory structure
+        :param lines: Iterable of non-empty lines without trailing whitespaces
         :return: Nested dictionary 
         """
+        lines = iter(lines)
+        
         # Extract the root directory name
-        root_name = lines[0].rstrip('/').strip()
+        root_line = next(lines, None)
+        if root_line is None:
+            raise ValueError("Input structure is empty")
+        # A UTF-8 byte order mark can only precede the first line, dropping it
+        # here avoids the per-chunk checks of the utf-8-sig codec
+        root_name = root_line.lstrip('\ufeff').rstrip('/').strip()
         root_dict = {root_name: {}}
-        current_dict = root_dict[root_name]
         
-        # Track the current path and hierarchy
-        hierarchy_stack = [current_dict]
-        current_hierarchy = []
+        # Parallel stacks of open directories and their indentation depth.
+        # The root depth is below any entry so it is never closed
+        dir_stack = [root_dict[root_name]]
+        depth_stack = [-1]
         
-        # Remove the root line and tree symbols from subsequent lines
-        cleaned_lines = []
-        for line in lines[1:]:
-            # Remove tree symbols (├, └, │, ─)
-            cleaned = re.sub(r'^[│├└─\s]+', '', line).strip()
-            if cleaned:
-                cleaned_lines.append(cleaned)
+        # Hoist global lookups out of the loop
+        tree_chars = _TREE_CHARS
         
-        for line in cleaned_lines:
+        for line in lines:
+            # Remove tree symbols (├, └, │, ─), every level is 4 characters wide.
+            # Lines are already stripped of trailing whitespaces
+            name = line.lstrip(tree_chars)
+            depth = (len(line) - len(name)) >> 2
+            if not name:
+                continue
+            
             # Determine if it's a directory or file
-            is_dir = line.endswith('/')
+            is_dir = name.endswith('/')
             
-            # Clean the line (remove trailing /)
-            clean_line = line.rstrip('/')
+            # Clean the name (remove trailing /)
+            name = name.rstrip('/')
+            
+            # Close directories that are not ancestors of this entry
+            while depth_stack[-1] >= depth:
+                dir_stack.pop()
+                depth_stack.pop()
+            current_location = dir_stack[-1]
             
             if is_dir:
-                # It's a directory
-                # Adjust hierarchy based on depth
-                while current_hierarchy and not self._is_parent_dir(current_hierarchy[-1], clean_line):
-                    current_hierarchy.pop()
-                    hierarchy_stack.pop()
-                
-                # Create or navigate to the directory
-                current_location = hierarchy_stack[-1]
-                current_location[clean_line] = {}
-                
-                # Update hierarchy
-                current_hierarchy.append(clean_line)
-                hierarchy_stack.append(current_location[clean_line])
+                # It's a directory, entries indented below it belong to it
+                current_location[name] = {}
+                dir_stack.append(current_location[name])
+                depth_stack.append(depth)
             else:
                 # It's a file
-                # Place the file in the current directory
-                current_location = hierarchy_stack[-1]
-                current_location[clean_line] = None
+                current_location[name] = None
         
         return root_dict
 
-    def _is_parent_dir(self, parent, child):
-        """
-        Check if parent is a parent directory of child.
-        
-        :param parent: Parent directory name
-        :param child: Potential child directory name
-        :return: Boolean indicating if parent is a parent directory
-        """
-        # Simple implementation - in more complex scenarios, this might need refinement
-        return child.startswith(parent) and child != parent
-
     def generate_json(self, input_file, output_file=None):
         """
         Generate JSON specification from the input text file.
         
-        :param input_file: Path to the input text file
+        :param input_file: Path to the input text file, or an open text file
         :param output_file: Optional path to save the JSON file
         :return: JSON representation of the project structure
         """
         # Parse the structure
         structure = self.parse_structure(input_file)
         
+        return self.dump_json(structure, output_file)
+
+    def dump_json(self, structure, output_file=None):
+        """
+        Serialize a parsed project structure to JSON.
+        
+        :param structure: Nested dictionary representing the project structure
+        :param output_file: Optional path to save the JSON file
+        :return: JSON representation of the project structure
+        """
         # Convert to JSON
         json_str = json.dumps(structure, indent=4)
         
@@ -114,13 +149,17 @@ class ProjectStructureParser:
 
 class ProjectStructureCreator:
     @staticmethod
-    def create_project_structure(tree_spec, base_path=None, confirm=True):
+    def create_project_structure(tree_spec, base_path=None, confirm=True, max_workers=32,
+                                 encoding=None):
         """
         Create a project folder and file structure based on a dictionary specification.
         
         :param tree_spec: Dictionary representing the folder/file structure
         :param base_path: Base directory where the structure will be created
         :param confirm: Whether to ask for user confirmation before creating
+        :param max_workers: Number of threads creating directories and files
+        :param encoding: Encoding of the initial content written to files
+                         (default: the locale's preferred encoding)
         """
         # Determine the base path
         if base_path is None:
@@ -132,11 +171,19 @@ class ProjectStructureCreator:
         
         root_name = list(tree_spec.keys())[0]
         root_structure = tree_spec[root_name]
-        full_path = os.path.join(base_path, root_name)
+        # Entry paths below the root are built by plain concatenation
+        full_path = os.path.join(os.fspath(base_path), root_name)
+        
+        # Validate input
+        if not isinstance(root_structure, dict):
+            raise ValueError("Tree specification must be a dictionary")
+
+        # Flatten the tree once so preview and creation are plain loops
+        levels, outline = ProjectStructureCreator._flatten(root_structure, full_path)
         
         # Preview the structure
         print("Proposed Project Structure:")
-        ProjectStructureCreator._preview_structure(root_structure, root_name)
+        ProjectStructureCreator._preview_structure(root_name, outline)
         
         # Ask for confirmation if enabled
         if confirm:
@@ -145,78 +192,181 @@ class ProjectStructureCreator:
                 print("Project creation cancelled.")
                 return
         
-        # Create the structure
-        def create_path(path_parts, is_file=False):
-            full_path = os.path.join(base_path, *path_parts)
-            if is_file:
-                # Ensure parent directory exists
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                # Create empty file
-                open(full_path, 'a').close()
-            else:
-                os.makedirs(full_path, exist_ok=True)
+        # File contents are written like a text mode open() would, in the
+        # locale's encoding and with platform line endings
+        if encoding is None:
+            encoding = locale.getpreferredencoding(False)
+        linesep = os.linesep
 
-        def process_tree(current_tree, current_path=None):
-            current_path = current_path or [root_name]
+        # Populate each directory through a single open handle, so its
+        # subdirectories and files are created by name instead of by a path
+        # the kernel has to resolve from the base directory for every entry
+        def populate(group):
+            path, dirs, files = group
+            dir_fd = ProjectStructureCreator._open_dir(path)
+            # Without a handle, entries are created by their full path
+            prefix = '' if dir_fd is not None else path + os.sep
             
-            for name, content in current_tree.items():
-                full_path = current_path + [name]
+            # Hoist global lookups out of the loops
+            os_mkdir, os_open, os_close, os_write = os.mkdir, os.open, os.close, os.write
+            touch_flags, write_flags = _TOUCH_FLAGS, _WRITE_FLAGS
+            try:
+                for name in dirs:
+                    try:
+                        os_mkdir(prefix + name, dir_fd=dir_fd)
+                    except FileExistsError:
+                        # Left by a previous run, created concurrently or a
+                        # sibling differing only in case on a case-insensitive
+                        # filesystem
+                        pass
                 
-                if isinstance(content, dict):
-                    # This is a directory
-                    create_path(full_path)
-                    # Recursively process subdirectories
-                    process_tree(content, full_path)
-                elif content is None:
-                    # This is an empty file
-                    create_path(full_path, is_file=True)
-                elif isinstance(content, str):
-                    # This is a file with optional initial content
-                    create_path(full_path, is_file=True)
-                    file_path = os.path.join(base_path, *full_path)
-                    with open(file_path, 'w') as f:
-                        f.write(content)
+                for kind, name, content in files:
+                    # Use raw file descriptors, a file object is not needed to
+                    # touch a file or write its content at once
+                    if kind == _EMPTY_FILE:
+                        # Empty file, existing files are left untouched
+                        os_close(os_open(prefix + name, touch_flags, 0o666, dir_fd=dir_fd))
+                    else:
+                        if linesep != '\n':
+                            content = content.replace('\n', linesep)
+                        # Slicing a memoryview after a partial write copies nothing
+                        data = memoryview(content.encode(encoding))
+                        fd = os_open(prefix + name, write_flags, 0o666, dir_fd=dir_fd)
+                        try:
+                            while data:
+                                data = data[os_write(fd, data):]
+                        finally:
+                            os_close(fd)
+            finally:
+                if dir_fd is not None:
+                    os.close(dir_fd)
 
-        # Validate input
-        if not isinstance(root_structure, dict):
-            raise ValueError("Tree specification must be a dictionary")
+        # Every other directory is created by the worker populating its parent
+        os.makedirs(full_path, exist_ok=True)
+
+        # Creation is bound by filesystem latency, so independent directories
+        # are populated concurrently. At most one handle is open per worker
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Wait for each level before creating the next one
+            for level in levels:
+                for _ in executor.map(populate, level):
+                    pass
 
-        # Create the structure
-        process_tree(root_structure)
         print(f"\nProject structure created in '{full_path}'")
 
     @staticmethod
-    def _preview_structure(structure, root_name, indent='', printed_dirs=None):
+    def _flatten(tree, path):
+        """
+        Flatten a nested structure into per-directory groups of files.
+        
+        Directories are grouped by depth so each level only depends on the
+        previous one, starting with the root directory itself. Names holding
+        path separators, such as 'src/lib.rs', imply their parent directories.
+        
+        :param tree: Dictionary representing the folder/file structure
+        :param path: Path of the root directory holding tree
+        :return: Tuple of directory levels as lists of (path, dirs, files)
+                 groups, where dirs are the names of its subdirectories and
+                 files are (kind, name, content) tuples, and
+                 a list of (depth, name, kind) entries in tree order
+        """
+        sep = os.sep
+        altsep = os.altsep
+        root_files = []
+        root_group = (path, [], root_files)
+        levels = [[root_group]]
+        groups = {path: root_group}
+        outline = []
+        
+        def group(parent, name, level):
+            # Directories implied by several entries get a single group
+            path = parent + sep + name
+            child = groups.get(path)
+            if child is None:
+                child = groups[path] = (path, [], [])
+                # The parent's worker creates the directory
+                groups[parent][1].append(name)
+                if len(levels) == level:
+                    levels.append([])
+                levels[level].append(child)
+            return child
+        
+        # Walk the tree in order with a stack of iterators, extending the path
+        # of each directory instead of re-joining it from the base path
+        entry_kinds = _ENTRY_KINDS
+        stack = [(iter(tree.items()), path, root_files, 0)]
+        while stack:
+            items, path, files, level = stack[-1]
+            depth = len(stack) - 1
+            
+            for name, content in items:
+                # Tag the entry once, later passes branch on the integer kind
+                kind = entry_kinds.get(type(content))
+                if kind is None:
+                    # Subclasses miss the exact-type lookup
+                    if isinstance(content, dict):
+                        kind = _DIR
+                    elif isinstance(content, str):
+                        kind = _CONTENT_FILE
+                    else:
+                        # Not a directory nor a file
+                        continue
+                
+                parent, parent_level, parent_files = path, level, files
+                if sep in name or (altsep and altsep in name):
+                    # Names such as 'src/lib.rs' imply their parent directories
+                    parts = [part for part in name.replace(altsep or sep, sep).split(sep) if part]
+                    if not parts:
+                        # Nothing to create, so nothing to preview either
+                        continue
+                    outline.append((depth, name, kind))
+                    name = parts.pop()
+                    for part in parts:
+                        parent_level += 1
+                        parent, _, parent_files = group(parent, part, parent_level)
+                else:
+                    outline.append((depth, name, kind))
+                
+                if kind == _DIR:
+                    # This is a directory
+                    child_path, _, child_files = group(parent, name, parent_level + 1)
+                    # Visit the subdirectory before its remaining siblings
+                    stack.append((iter(content.items()), child_path, child_files, parent_level + 1))
+                    break
+                else:
+                    # This is a file, either empty or with initial content
+                    parent_files.append((kind, name, content))
+            else:
+                stack.pop()
+        
+        return levels, outline
+
+    @staticmethod
+    def _open_dir(path):
+        """
+        Open a directory handle to create entries relative to.
+        
+        :param path: Path of an existing directory
+        :return: File descriptor, or None if the platform lacks dir_fd support
+        """
+        if not _HAVE_DIR_FD:
+            return None
+        return os.open(path, _DIR_FLAGS)
+
+    @staticmethod
+    def _preview_structure(root_name, outline):
         """
         Print a preview of the project structure.
         
-        :param structure: Dictionary representing the project structure
         :param root_name: Name of the root directory
-        :param indent: Current indentation level
-        :param printed_dirs: Set to track printed directories and avoid duplicates
+        :param outline: List of (depth, name, kind) entries in tree order
         """
-        if printed_dirs is None:
-            printed_dirs = set()
-
-        # Only print root name if it hasn't been printed before
-        if root_name not in printed_dirs:
-            print(f"{indent}{root_name}/")
-            printed_dirs.add(root_name)
-        
-        next_indent = indent + '    '
-        
-        for name, content in structure.items():
-            if content is None:
-                # File
-                print(f"{next_indent}{name}")
-            elif isinstance(content, dict):
-                # Prevent duplicating directory names in the preview
-                if name not in printed_dirs:
-                    print(f"{next_indent}{name}/")
-                    printed_dirs.add(name)
-                
-                # Recursively preview subdirectories
-                ProjectStructureCreator._preview_structure(content, name, next_indent, printed_dirs)
+        lines = [f"{root_name}/"]
+        lines.extend(f"{'    ' * (depth + 1)}{name}{'/' if kind == _DIR else ''}"
+                     for depth, name, kind in outline)
+        
+        # Write the whole preview at once
+        sys.stdout.write('\n'.join(lines) + '\n')
 
 def main():
     # Argument parsing
@@ -230,17 +380,22 @@ def main():
                         help='File encoding (default: utf-8)')
     parser.add_argument('-y', '--yes', action='store_true',
                         help='Skip confirmation and create project structure')
+    parser.add_argument('-w', '--workers', type=int, default=32,
+                        help='Number of threads creating files and folders (default: 32)')
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error('argument -w/--workers: must be at least 1')
 
     try:
         # Initialize parser with specified encoding
         parser = ProjectStructureParser(encoding=args.encoding)
         
-        # Generate JSON (optionally save to file)
-        json_spec = parser.generate_json(args.input_file, args.json_output)
+        # Parse the project structure specification
+        tree_spec = parser.parse_structure(args.input_file)
         
-        # Parse JSON specification and create project structure
-        tree_spec = json.loads(json_spec)
+        # Save the JSON specification if requested
+        if args.json_output:
+            parser.dump_json(tree_spec, args.json_output)
         
         # Determine base directory
         base_dir = args.directory or os.getcwd()
@@ -249,7 +404,8 @@ def main():
         ProjectStructureCreator.create_project_structure(
             tree_spec, 
             base_path=base_dir, 
-            confirm=not args.yes
+            confirm=not args.yes,
+            max_workers=args.workers
         )
     
     except Exception as e:
@@ -0,0 +1,130 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from filestructure import ProjectStructureCreator, ProjectStructureParser
+
+
+class ProjectStructureParserTest(unittest.TestCase):
+    def parse(self, text):
+        return ProjectStructureParser().parse_structure(io.StringIO(text))
+
+    def test_nested_structure(self):
+        structure = self.parse(
+            "game/\n"
+            "├── Cargo.toml\n"
+            "└── src/\n"
+            "    ├── main.rs\n"
+            "    └── plugins/\n"
+            "        └── player_plugin.rs\n"
+        )
+        self.assertEqual(structure, {
+            'game': {
+                'Cargo.toml': None,
+                'src': {
+                    'main.rs': None,
+                    'plugins': {'player_plugin.rs': None},
+                },
+            },
+        })
+
+    def test_non_breaking_space_indentation(self):
+        # GNU tree output indents nested levels with non-breaking spaces
+        structure = self.parse(
+            "game/\n"
+            "├── src/\n"
+            "│\u00a0\u00a0 ├── main.rs\n"
+            "│\u00a0\u00a0 └── utils/\n"
+            "│\u00a0\u00a0     └── rarity.rs\n"
+            "└── Cargo.toml\n"
+        )
+        self.assertEqual(structure, {
+            'game': {
+                'src': {
+                    'main.rs': None,
+                    'utils': {'rarity.rs': None},
+                },
+                'Cargo.toml': None,
+            },
+        })
+
+    def test_byte_order_mark(self):
+        structure = self.parse("\ufeffr/\n├── a\n")
+        self.assertEqual(structure, {'r': {'a': None}})
+
+    def test_tab_indentation(self):
+        structure = self.parse("r/\n\tsrc/\n\t\tmain.rs\n\tREADME\n")
+        self.assertEqual(structure, {
+            'r': {
+                'src': {'main.rs': None},
+                'README': None,
+            },
+        })
+
+
+class ProjectStructureCreatorTest(unittest.TestCase):
+    def create(self, tree_spec, base_path=None):
+        if base_path is None:
+            base_path = tempfile.mkdtemp()
+            self.addCleanup(shutil.rmtree, base_path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ProjectStructureCreator.create_project_structure(
+                tree_spec, base_path=base_path, confirm=False
+            )
+        return os.path.join(base_path, *tree_spec)
+
+    def test_names_with_separators(self):
+        root = self.create({
+            'proj': {
+                '.github/workflows': {'ci.yml': None},
+                'src/lib.rs': 'pub fn run() {}',
+                'src': {'main.rs': None},
+            },
+        })
+        self.assertTrue(os.path.isfile(os.path.join(root, '.github', 'workflows', 'ci.yml')))
+        self.assertTrue(os.path.isfile(os.path.join(root, 'src', 'main.rs')))
+        with open(os.path.join(root, 'src', 'lib.rs')) as f:
+            self.assertEqual(f.read(), 'pub fn run() {}')
+
+    def test_subclassed_values(self):
+        class Content(str):
+            pass
+
+        root = self.create({'proj': {'notes.txt': Content('hello')}})
+        with open(os.path.join(root, 'notes.txt')) as f:
+            self.assertEqual(f.read(), 'hello')
+
+    def test_directory_created_concurrently(self):
+        # Another creator makes the directory between the failed open and mkdir
+        real_mkdir = os.mkdir
+
+        def racing_mkdir(path, *args, **kwargs):
+            real_mkdir(path, *args, **kwargs)
+            if os.path.basename(path) == 'racy':
+                raise FileExistsError(path)
+
+        with mock.patch('filestructure.os.mkdir', racing_mkdir):
+            root = self.create({'proj': {'racy': {'file.txt': None}}})
+        self.assertTrue(os.path.isfile(os.path.join(root, 'racy', 'file.txt')))
+
+    def test_existing_structure_is_kept(self):
+        tree_spec = {'proj': {'src': {'main.rs': None}}}
+        root = self.create(tree_spec)
+        src = os.path.join(root, 'src')
+        with open(os.path.join(src, 'main.rs'), 'w') as f:
+            f.write('fn main() {}')
+        inode = os.stat(src).st_ino
+
+        # Creating the structure again leaves existing entries untouched
+        self.create(tree_spec, base_path=os.path.dirname(root))
+        self.assertEqual(os.stat(src).st_ino, inode)
+        with open(os.path.join(src, 'main.rs')) as f:
+            self.assertEqual(f.read(), 'fn main() {}')
+
+
+if __name__ == '__main__':
+    unittest.main()